@@ -25,6 +25,23 @@ class Game:
     """
 
     FPS_CAP = 60
+    # Input events nothing in the game listens to, blocked so they
+    # never reach the per-frame event loops
+    BLOCKED_EVENTS = [
+        pygame.KEYUP,
+        pygame.TEXTINPUT,
+        pygame.TEXTEDITING,
+        pygame.MOUSEWHEEL,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+        pygame.MULTIGESTURE,
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+    ]
 
     def __init__(self):
         """
@@ -34,6 +51,7 @@ class Game:
 
         self.alive = True
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED)
+        pygame.event.set_blocked(self.BLOCKED_EVENTS)
         if SAVE_DATA["first_time"]:
             self.state: States = States.DIALOGUE
         else:
@@ -150,20 +150,20 @@ class BackGroundEffect:
     def update(self, event_info):
         dt = event_info["dt"]
 
+        # Dead ones are filtered out after the loop, removing them
+        # while iterating skipped the update of the next element
         for line in self.lines:
             line.update(dt)
-
-            if not line.alive:
-                self.lines.remove(line)
+        self.lines = [line for line in self.lines if line.alive]
 
         if self.line_gen.update():
             self.lines.append(_Line())
 
         for rect in self.rotating_rectangles:
             rect.update(dt)
-
-            if not rect.alive:
-                self.rotating_rectangles.remove(rect)
+        self.rotating_rectangles = [
+            rect for rect in self.rotating_rectangles if rect.alive
+        ]
 
         if self.rotat_rect_gen.update():
             self.rotating_rectangles.append(_RotatingRect(self.assets["rotating_rect"]))
@@ -22,6 +22,12 @@ class Enemy(Entity):
         self.rect = pygame.Rect((obj.x, obj.y), self.size)
         self.name = obj.name
 
+    def blit_info(self, camera) -> typing.Tuple[pygame.Surface, typing.Tuple[int, int]]:
+        """
+        Returns the (surface, pos) pair to blit for the current frame
+        """
+        return self.surf, camera.apply(self.rect).topleft
+
     def handle_collision(
         self, neighboring_tiles: typing.List[typing.Any], player
     ) -> None:
@@ -35,7 +41,8 @@ class Enemy(Entity):
 
         self.rect.x += round(self.vel.x)
 
-        for neighboring_tile in neighboring_tiles:
+        for index in self.rect.collidelistall(neighboring_tiles):
+            neighboring_tile = neighboring_tiles[index]
             if neighboring_tile.rect.colliderect(self.rect):
                 if self.vel.x > 0:
                     self.rect.right = neighboring_tile.rect.left
@@ -50,7 +57,8 @@ class Enemy(Entity):
 
         self.rect.y += round(self.vel.y)
 
-        for neighboring_tile in neighboring_tiles:
+        for index in self.rect.collidelistall(neighboring_tiles):
+            neighboring_tile = neighboring_tiles[index]
             if neighboring_tile.rect.colliderect(self.rect):
                 if self.vel.y > 0:
                     self.vel.y = 0
@@ -121,7 +129,7 @@ class MovingWall(Enemy):
         # pygame.draw.rect(
         #     screen, (42, 45, 55), (camera.apply(self.rect).topleft, self.rect.size)
         # )
-        screen.blit(self.surf, camera.apply(self.rect).topleft)
+        screen.blit(*self.blit_info(camera))
         # pygame.draw.rect(screen, (42, 45, 55), (0, 0, self.rect.width, self.rect.height))
 
 
@@ -211,7 +219,7 @@ class MovingPlatform(Enemy):
             self.last_turned = pygame.time.get_ticks()
 
     def draw(self, dt: float, screen: pygame.Surface, camera):
-        screen.blit(self.surf, camera.apply(self.rect).topleft)
+        screen.blit(*self.blit_info(camera))
 
 
 class Ungrappleable:
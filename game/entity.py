@@ -57,7 +57,10 @@ class Entity(abc.ABC):
         """
         self.rect.x += round(self.vel.x)
 
-        for neighboring_tile in neighboring_tiles:
+        # collidelistall does the broadphase in C, the loop below
+        # re-checks since resolving one tile can clear the others
+        for index in self.rect.collidelistall(neighboring_tiles):
+            neighboring_tile = neighboring_tiles[index]
             if neighboring_tile.rect.colliderect(self.rect):
                 if self.vel.x > 0:
                     self.rect.right = neighboring_tile.rect.left
@@ -66,7 +69,8 @@ class Entity(abc.ABC):
 
         self.rect.y += round(self.vel.y)
 
-        for neighboring_tile in neighboring_tiles:
+        for index in self.rect.collidelistall(neighboring_tiles):
+            neighboring_tile = neighboring_tiles[index]
             if neighboring_tile.rect.colliderect(self.rect):
                 if self.vel.y > 0:
                     self.vel.y = 0
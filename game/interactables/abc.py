@@ -42,5 +42,11 @@ class Interactable(abc.ABC):
         if self.interacting:
             self.img = self.interacting_img
 
+    def blit_info(self, camera: Camera) -> tuple[pygame.Surface, pygame.Rect]:
+        """
+        Returns the (surface, pos) pair to blit for the current frame
+        """
+        return self.img, camera.apply(self.rect)
+
     def draw(self, screen: pygame.Surface, camera: Camera):
-        screen.blit(self.img, camera.apply(self.rect))
+        screen.blit(*self.blit_info(camera))
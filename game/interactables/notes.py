@@ -35,6 +35,12 @@ class Note(Interactable):
         self.alpha_expansion.update(self.interacting, event_info["dt"])
         self.text_surf.set_alpha(int(self.alpha_expansion.number))
 
+    def text_blit_info(self, camera: Camera) -> tuple[pygame.Surface, pygame.Rect]:
+        """
+        Returns the (surface, pos) pair to blit for the note's text
+        """
+        return self.text_surf, camera.apply(self.text_rect)
+
     def draw(self, screen: pygame.Surface, camera: Camera) -> None:
         super().draw(screen, camera)
-        screen.blit(self.text_surf, camera.apply(self.text_rect))
+        screen.blit(*self.text_blit_info(camera))
@@ -5,8 +5,9 @@ The source code is distributed under the MIT license.
 
 import abc
 from asyncio import events
+import functools
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 import pygame
 
@@ -25,6 +26,7 @@ from game.utils import load_font, load_settings
 from library.effects import ExplosionManager
 from library.particles import ParticleManager, TextParticle
 from library.sfx import SFXManager
+from library.spatial_hash import SpatialHash
 from library.sprite.load import load_assets
 from library.tilemap import TileLayerMap
 from library.tiles import SpikeTile
@@ -32,11 +34,55 @@ from library.transition import FadeTransition
 from library.ui.buttons import Button
 from library.ui.camera import Camera
 from library.ui.healthbar import PlayerHealthBar
+from library.utils.funcs import fblits
 
 logger = logging.getLogger()
 
+# One bit per dimension, for the traveled dimensions bitmask
+_DIMENSION_BITS = {dimension: 1 << index for index, dimension in enumerate(Dimensions)}
+
 
 class InitLevelStage(abc.ABC):
+    # Every stage declares the attributes it introduces
+    __slots__ = (
+        "switch_info",
+        "current_dimension",
+        "latest_checkpoint",
+        "camera",
+        "_map_blit_pos",
+        "sfx_manager",
+        "assets",
+        "tilemap",
+        "transition",
+        "next_state",
+        "settings",
+        "unlocked_dimensions",
+        "dimensions_traveled",
+        "_banner_font",
+        "_banner_cache",
+        "enemies",
+        "moving_walls",
+        "moving_platforms",
+        "ungrappleables",
+        "portals",
+        "notes",
+        "spikes",
+        "_banner_particles",
+        "particle_manager",
+        "latest_checkpoint_id",
+        "checkpoints",
+        "checkpoint_hash",
+        "num_extra_dims_unlocked",
+        "player",
+        "_explosion_manager",
+        "turret_explosioner",
+        "paused",
+        "_update_pipeline",
+        "_draw_pipeline",
+    )
+
+    FADE_SPEED = 4
+
     def __init__(self, switch_info: dict) -> None:
         """
         Initialize some attributes
@@ -49,9 +95,10 @@ class InitLevelStage(abc.ABC):
         self.latest_checkpoint = SAVE_DATA["latest_checkpoint"]
 
         self.camera = Camera(WIDTH, HEIGHT)
+        # Screen position of the map, updated along with the camera
+        self._map_blit_pos = (0, 0)
         self.sfx_manager = SFXManager("level")
         self.assets = load_assets("level")
-        self.event_info = {"dt": 0}
 
         self.tilemap = TileLayerMap(MAP_DIR / "dimension_one.tmx")
 
@@ -68,26 +115,39 @@ class InitLevelStage(abc.ABC):
             Dimensions.VOLCANIC_DIMENSION,
         ]
 
-        self.dimensions_traveled = {self.current_dimension}
-        self.enemies = set()
-        self.portals = set()
-        self.notes = set()
+        self.dimensions_traveled = _DIMENSION_BITS[self.current_dimension]
+        self._banner_font = load_font(8)
+        self._banner_cache: dict[Dimensions, pygame.Surface] = {}
+        # Every enemy, for code that has to look at all of them (player
+        # collisions, grapple), plus one list per kind so the per-frame
+        # loops run over homogeneous entities without checking names
+        self.enemies = []
+        self.moving_walls = []
+        self.moving_platforms = []
+        self.ungrappleables = []
+        self.portals = []
+        self.notes = []
         self.spikes = set()
+        self._banner_particles: dict[Dimensions, list[TextParticle]] = {}
         self.particle_manager = ParticleManager(self.camera)
 
         self.latest_checkpoint_id = SAVE_DATA["latest_checkpoint_id"]
 
-        self.checkpoints = {
+        self.checkpoints = [
             Checkpoint(
                 pygame.Rect(obj.x, obj.y, obj.width, obj.height), self.particle_manager, obj.unlock_dimension, obj.c_id
             )
             for obj in self.tilemap.tilemap.get_layer_by_name("checkpoints")
-        }
+        ]
+        # Checkpoints never move, so they're hashed once
+        self.checkpoint_hash = SpatialHash(64)
+        for checkpoint in self.checkpoints:
+            self.checkpoint_hash.insert(checkpoint.rect, checkpoint)
         self.num_extra_dims_unlocked = SAVE_DATA["num_extra_dims_unlocked"]
 
         for portal_obj in self.tilemap.tilemap.get_layer_by_name("portals"):
             if portal_obj.name == "portal":
-                self.portals.add(
+                self.portals.append(
                     Portal(portal_obj, self.unlocked_dimensions, self.assets["portal"])
                 )
 
@@ -102,88 +162,170 @@ class InitLevelStage(abc.ABC):
             self.camera,
             self.particle_manager,
         )
-        self.explosion_manager = ExplosionManager("fire")
+        # Only created once something explodes, see explosion_manager
+        self._explosion_manager: Optional[ExplosionManager] = None
         self.turret_explosioner = ExplosionManager("turret")
 
         self.paused = False
 
-    def update(*args, **kwargs):
-        pass
+        # Every stage registers its per-frame work here, in init order,
+        # and Level runs them without walking the super() chain
+        self._update_pipeline: list[Callable[[EventInfo], None]] = []
+        self._draw_pipeline: list[Callable[[pygame.Surface], None]] = []
+
+    @property
+    def explosion_manager(self) -> ExplosionManager:
+        if self._explosion_manager is None:
+            self._explosion_manager = ExplosionManager("fire")
 
-    def draw(*args, **kwargs):
-        pass
+        return self._explosion_manager
+
+    def _freeze_collections(self) -> None:
+        """
+        Turns the entity collections into tuples once every stage filled
+        them in, they're only iterated from then on
+        """
+        self.enemies = tuple(self.enemies)
+        self.moving_walls = tuple(self.moving_walls)
+        self.moving_platforms = tuple(self.moving_platforms)
+        self.ungrappleables = tuple(self.ungrappleables)
+        self.portals = tuple(self.portals)
+        self.notes = tuple(self.notes)
+        self.checkpoints = tuple(self.checkpoints)
+
+    def _acquire_banner_particle(
+        self, screen: pygame.Surface, dimension: Dimensions
+    ) -> TextParticle:
+        """
+        Reuses a dead banner particle of the dimension if there is one,
+        so its banner surface is only copied the first time it's shown
+        """
+        particles = self._banner_particles.setdefault(dimension, [])
+        for particle in particles:
+            if not particle.alive:
+                particle.screen = screen
+                particle.reset(
+                    particle.image, self.player.vec, (0, -1.5), 3, lifespan=80
+                )
+                return particle
+
+        particle = TextParticle(
+            screen=screen,
+            # The particle fades by changing its image alpha,
+            # so it gets its own copy of the cached banner
+            image=self._banner_cache[dimension].copy(),
+            pos=self.player.vec,
+            vel=(0, -1.5),
+            alpha_speed=3,
+            lifespan=80,
+        )
+        particles.append(particle)
+        return particle
 
 
 class RenderBackgroundStage(InitLevelStage):
+    __slots__ = ("background_manager",)
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
         self.background_manager = BackGroundEffect(self.assets)
 
-    def update(self):
-        self.background_manager.update(self.event_info)
+        self._update_pipeline.append(self._update_background)
+        self._draw_pipeline.append(self._draw_background)
+
+    def _update_background(self, event_info: EventInfo):
+        self.background_manager.update(event_info)
 
-    def draw(self, screen):
+    def _draw_background(self, screen):
         self.background_manager.draw(screen, self.camera, self.current_dimension)
 
 
 class RenderCheckpointStage(RenderBackgroundStage):
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
+    __slots__ = ()
+
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._draw_pipeline.append(self._draw_checkpoints)
 
+    def _draw_checkpoints(self, screen: pygame.Surface):
         for checkpoint in self.checkpoints:
             checkpoint.draw(screen)
 
 
 class RenderPortalStage(RenderCheckpointStage):
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
+    __slots__ = ()
 
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._draw_pipeline.append(self._draw_portals)
+
+    def _add_particle(self, particle) -> None:
+        self.particle_manager.add(particle)
+
+    def _draw_portals(self, screen: pygame.Surface):
         for portal in self.portals:
             if portal.dimension_change:
-                font = load_font(8)
-                formatted_txt = portal.current_dimension.value.replace("_", " ").title()
-
-                text_particle = TextParticle(
-                    screen=screen,
-                    image=font.render(
+                if portal.current_dimension not in self._banner_cache:
+                    formatted_txt = portal.current_dimension.value.replace(
+                        "_", " "
+                    ).title()
+                    self._banner_cache[
+                        portal.current_dimension
+                    ] = self._banner_font.render(
                         f"Switched to: {formatted_txt}", True, (218, 224, 234)
-                    ),
-                    pos=self.player.vec,
-                    vel=(0, -1.5),
-                    alpha_speed=3,
-                    lifespan=80,
+                    ).convert_alpha()
+
+                text_particle = self._acquire_banner_particle(
+                    screen, portal.current_dimension
                 )
 
-                if portal.current_dimension not in self.dimensions_traveled:
-                    self.dimensions_traveled.add(portal.current_dimension)
+                dimension_bit = _DIMENSION_BITS[portal.current_dimension]
+                if not self.dimensions_traveled & dimension_bit:
+                    self.dimensions_traveled |= dimension_bit
 
                     self.transition.fade_out_in(
-                        on_finish=lambda: self.particle_manager.add(text_particle)
+                        on_finish=functools.partial(self._add_particle, text_particle)
                     )
                 else:
                     self.particle_manager.add(text_particle)
 
-            portal.draw(screen, self.camera)
+        fblits(screen, [portal.blit_info(self.camera) for portal in self.portals])
 
 
 class RenderNoteStage(RenderPortalStage):
-    def draw(self, screen):
-        super().draw(screen)
+    __slots__ = ()
+
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._draw_pipeline.append(self._draw_notes)
+
+    def _draw_notes(self, screen):
+        blit_sequence = []
         for note in self.notes:
-            note.draw(screen, self.camera)
+            blit_sequence.append(note.blit_info(self.camera))
+            blit_sequence.append(note.text_blit_info(self.camera))
+
+        fblits(screen, blit_sequence)
 
 
 class RenderEnemyStage(RenderNoteStage):
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
-        for enemy in self.enemies:
-            if enemy.name == "ungrappleable":
-                continue
+    __slots__ = ()
 
-            enemy.draw(self.event_info["dt"], screen, self.camera)
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._draw_pipeline.append(self._draw_enemies)
+
+    def _draw_enemies(self, screen: pygame.Surface):
+        fblits(
+            screen,
+            [wall.blit_info(self.camera) for wall in self.moving_walls]
+            + [platform.blit_info(self.camera) for platform in self.moving_platforms],
+        )
 
 
 class ShooterStage(RenderEnemyStage):
+    __slots__ = ("shooters",)
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
         self.shooters = {
@@ -191,11 +333,12 @@ class ShooterStage(RenderEnemyStage):
             for obj in self.tilemap.tilemap.get_layer_by_name("shooters")
         }
 
-    def update(self) -> None:
-        super().update()
+        self._update_pipeline.append(self._update_shooters)
+        self._draw_pipeline.append(self._draw_shooters)
 
+    def _update_shooters(self, event_info: EventInfo) -> None:
         for shooter in set(self.shooters):
-            dm, vec, pos = shooter.update(self.player, self.event_info["dt"])
+            dm, vec, pos = shooter.update(self.player, event_info["dt"])
             if vec:
                 self.explosion_manager.create_explosion(self.camera.apply(vec).topleft)
             
@@ -208,9 +351,7 @@ class ShooterStage(RenderEnemyStage):
             if not shooter.alive:
                 self.shooters.remove(shooter)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        super().draw(screen)
-
+    def _draw_shooters(self, screen: pygame.Surface) -> None:
         for shooter in self.shooters:
             shooter.draw(screen, self.camera)
 
@@ -220,17 +361,21 @@ class TileStage(ShooterStage):
     Handles tilemap rendering
     """
 
+    __slots__ = ("_map_surfs", "map_surf", "_special_tiles")
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
         # self.tilemap = TileLayerMap(MAP_DIR / f"{self.current_dimension.value}.tmx"
 
-        self.tilesets = {enm: self.assets[enm.value] for enm in Dimensions}
-
-        self.map_surf = self.tilemap.make_map(self.tilesets[self.current_dimension])
+        # Rendering the whole map is slow and each one is big, so a
+        # dimension's map is rendered the first time it's needed and
+        # later portal switches only swap the surface
+        self._map_surfs: dict[Dimensions, pygame.Surface] = {}
+        self.map_surf = self._get_map_surf(self.current_dimension)
 
         for enemy_obj in self.tilemap.tilemap.get_layer_by_name("enemies"):
             if enemy_obj.name == "moving_wall":
-                self.enemies.add(
+                self.moving_walls.append(
                     MovingWall(
                         self.settings[self.current_dimension.value],
                         enemy_obj,
@@ -238,27 +383,42 @@ class TileStage(ShooterStage):
                     )
                 )
             elif enemy_obj.name == "moving_platform":
-                self.enemies.add(
+                self.moving_platforms.append(
                     MovingPlatform(
                         self.settings[self.current_dimension.value],
                         enemy_obj,
-                        self.tilesets[self.current_dimension],
+                        self.assets[self.current_dimension.value],
                     )
                 )
             elif enemy_obj.name == "ungrappleable":
-                self.enemies.add(
+                self.ungrappleables.append(
                     Ungrappleable(
                         enemy_obj
                     )
                 )
 
+        self.enemies.extend(self.moving_walls)
+        self.enemies.extend(self.moving_platforms)
+        self.enemies.extend(self.ungrappleables)
+
         for spike_obj in self.tilemap.tilemap.get_layer_by_name("spikes"):
             if spike_obj.name == "spike":
                 self.spikes.add(SpikeTile(self.assets["spike"], spike_obj))
 
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
-        screen.blit(self.map_surf, self.camera.apply((0, 0)))
+        self._draw_pipeline.append(self._draw_tiles)
+
+    def _get_map_surf(self, dimension: Dimensions) -> pygame.Surface:
+        map_surf = self._map_surfs.get(dimension)
+        if map_surf is None:
+            map_surf = self.tilemap.make_map(self.assets[dimension.value])
+            self._map_surfs[dimension] = map_surf
+            # Rendering a map recreates the tilemap's special tiles
+            self._special_tiles = tuple(self.tilemap.special_tiles.values())
+
+        return map_surf
+
+    def _draw_tiles(self, screen: pygame.Surface):
+        screen.blit(self.map_surf, self._map_blit_pos)
 
 
 class PlayerStage(TileStage):
@@ -266,6 +426,8 @@ class PlayerStage(TileStage):
     Handle player related actions
     """
 
+    __slots__ = ()
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
 
@@ -273,83 +435,84 @@ class PlayerStage(TileStage):
         #     self.settings[self.current_dimension.value], self.assets["dave_walk"]
         # )
 
-    def update(self, event_info: EventInfo):
-        super().update()
+        self._update_pipeline.append(self._update_player)
+        self._draw_pipeline.append(self._draw_player)
 
+    def _update_player(self, event_info: EventInfo):
         self.player.update(event_info, self.tilemap, self.enemies)
-        self.event_info = event_info
 
         # Temporary checking here
         if self.player.y > 2500:
             self.player.alive = False
 
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
+    def _draw_player(self, screen: pygame.Surface):
         self.player.draw(screen, self.camera)
 
 
 class ItemStage(PlayerStage):
+    __slots__ = ()
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
 
-    def draw(self, screen):
-        super().draw(screen)
-        # self.grapple.draw(screen)
-
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
-        # self.grapple.update(event_info, self.tilemap, self.enemies)
-
 
 class SpecialTileStage(ItemStage):
+    __slots__ = ()
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
+        self._update_pipeline.append(self._update_special_tiles)
 
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
-
-        for special_tiles in self.tilemap.special_tiles.values():
-            special_tiles.update(self.player)
+    def _update_special_tiles(self, event_info: EventInfo):
+        for special_tile in self._special_tiles:
+            special_tile.update(self.player)
 
 
 class EnemyStage(SpecialTileStage):
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+    __slots__ = ()
 
-        for enemy in self.enemies:
-            if enemy.name == "ungrappleable":
-                continue
-            
-            if enemy.name == "moving_platform":
-                enemy.update(event_info, self.tilemap, self.player, self.shooters)
-            else:
-                enemy.update(event_info, self.tilemap, self.player)
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._update_pipeline.append(self._update_enemies)
+
+    def _update_enemies(self, event_info: EventInfo):
+        for wall in self.moving_walls:
+            wall.update(event_info, self.tilemap, self.player)
+
+        for platform in self.moving_platforms:
+            platform.update(event_info, self.tilemap, self.player, self.shooters)
 
 
 class SpikeStage(EnemyStage):
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+    __slots__ = ()
 
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._update_pipeline.append(self._update_spikes)
+        self._draw_pipeline.append(self._draw_spikes)
+
+    def _update_spikes(self, event_info: EventInfo):
         for spike in self.spikes:
             spike.update(self.player)
 
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
-
+    def _draw_spikes(self, screen: pygame.Surface):
         for spike in self.spikes:
             spike.draw(screen, self.camera)
 
 
 class CheckpointStage(SpikeStage):
+    __slots__ = ()
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
+        self._update_pipeline.append(self._update_checkpoints)
 
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
-
+    def _update_checkpoints(self, event_info: EventInfo):
         latest_checkpoint_id_cp = self.latest_checkpoint_id
 
-        for checkpoint in self.checkpoints:
+        # Checkpoints away from the player can't collide with it,
+        # so their update would be a no-op
+        for checkpoint in self.checkpoint_hash.query(self.player.rect):
 
             if not checkpoint.text_spawned and checkpoint.rect.colliderect(
                 self.player.rect
@@ -380,80 +543,104 @@ class CheckpointStage(SpikeStage):
 
 
 class NoteStage(CheckpointStage):
+    __slots__ = ()
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
-        self.notes = {
+        self.notes = [
             Note(self.assets["note"], (obj.x, obj.y), obj.properties["text"])
             for obj in self.tilemap.tilemap.get_layer_by_name("notes")
-        }
+        ]
+        self._update_pipeline.append(self._update_notes)
 
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+    def _update_notes(self, event_info: EventInfo):
         for note in self.notes:
             note.update(event_info, self.player.rect)
 
 
 class PortalStage(NoteStage):
+    __slots__ = ("_synced_dimension",)
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
 
         """for portal_obj in self.tilemap.tilemap.get_layer_by_name("portals"):
             if portal_obj.name == "portal":
-                self.portals.add(
+                self.portals.append(
                     Portal(portal_obj, self.unlocked_dimensions, self.assets["portal"])
                 )"""
 
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+        # Dimension the portals were last synced to,
+        # None so they get synced on the first frame
+        self._synced_dimension: Optional[Dimensions] = None
+        self._update_pipeline.append(self._update_portals)
 
+    def _update_portals(self, event_info: EventInfo):
+        switched = False
         for portal in self.portals:
             # if we aren't changing the dimension,
             # we have to reset portal's dimension to the current one
+            # (only needed once the current dimension changed)
             if not portal.dimension_change:
-                portal.current_dimension = self.current_dimension
-                SAVE_DATA["latest_dimension"] = self.current_dimension.value
+                if self._synced_dimension is not self.current_dimension:
+                    portal.current_dimension = self.current_dimension
+                    SAVE_DATA["latest_dimension"] = self.current_dimension.value
             # otherwise (if we're switching dimension)
             else:
+                switched = True
                 logger.info(f"Changed dimension to: {portal.current_dimension}")
 
                 self.current_dimension = portal.current_dimension
-                self.map_surf = self.tilemap.make_map(
-                    self.tilesets[self.current_dimension]
-                )
+                self.map_surf = self._get_map_surf(self.current_dimension)
 
                 # change player's settings
                 self.player.change_settings(self.settings[self.current_dimension.value])
                 # change enemy settings
-                for enemy in self.enemies:
-                    if enemy.name == "ungrappleable":
-                        continue
-
-                    enemy.change_settings(self.settings[self.current_dimension.value])
+                for wall in self.moving_walls:
+                    wall.change_settings(self.settings[self.current_dimension.value])
 
-                    if enemy.name == "moving_platform":
-                        enemy.surf = enemy.assemble_img(
-                            self.tilesets[self.current_dimension]
-                        )
+                for platform in self.moving_platforms:
+                    platform.change_settings(
+                        self.settings[self.current_dimension.value]
+                    )
+                    platform.surf = platform.assemble_img(
+                        self.assets[self.current_dimension.value]
+                    )
 
             portal.update(self.player, event_info)
 
+        # Portals earlier in the list than the one that switched
+        # still hold the old dimension, so they're synced next frame
+        if not switched:
+            self._synced_dimension = self.current_dimension
+
         # Unlocking dimensions
-        for event in event_info["events"]:
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_5:
-                for dimension in Dimensions:
-                    if dimension not in self.unlocked_dimensions:
-                        self.unlocked_dimensions.append(dimension)
-                        break
+        if any(
+            event.type == pygame.KEYDOWN and event.key == pygame.K_5
+            for event in event_info["events"]
+        ):
+            for dimension in Dimensions:
+                if dimension not in self.unlocked_dimensions:
+                    self.unlocked_dimensions.append(dimension)
+                    break
+            else:
+                # Everything is unlocked already
+                return
 
-                for portal in self.portals:
-                    portal.unlock_dimension(self.unlocked_dimensions)
+            for portal in self.portals:
+                portal.unlock_dimension(self.unlocked_dimensions)
 
 
 class CameraStage(PortalStage):
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+    __slots__ = ()
+
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._update_pipeline.append(self._update_camera)
 
+    def _update_camera(self, event_info: EventInfo):
         self.camera.adjust_to(event_info["dt"], self.player.rect)
+        self._map_blit_pos = self.camera.apply((0, 0))
 
 
 class UIStage(CameraStage):
@@ -461,32 +648,35 @@ class UIStage(CameraStage):
     Handles buttons
     """
 
+    __slots__ = ("buttons", "healthbar")
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
         self.buttons = ()
         self.healthbar = PlayerHealthBar(self.player, self.particle_manager, (10, 10), 180, 15)
 
-    def update(self, event_info: EventInfo):
+        self._update_pipeline.append(self._update_ui)
+        self._draw_pipeline.append(self._draw_ui)
+
+    def _update_ui(self, event_info: EventInfo):
         """
         Update the Button state
 
         Parameters:
             event_info: Information on the window events
         """
-        super().update(event_info)
         for button in self.buttons:
             button.update(event_info["mouse_pos"], event_info["mouse_press"])
 
         self.particle_manager.update(event_info)
 
-    def draw(self, screen: pygame.Surface):
+    def _draw_ui(self, screen: pygame.Surface):
         """
         Draw the Button state
 
         Parameters:
             screen: pygame.Surface to draw on
         """
-        super().draw(screen)
         for button in self.buttons:
             button.draw(screen)
 
@@ -495,11 +685,12 @@ class UIStage(CameraStage):
 
 
 class SFXStage(UIStage):
+    __slots__ = ("sound_icon",)
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
         stub_rect = pygame.Rect(0, 0, 16, 16)
-        stub_rect.topright = pygame.Surface((WIDTH, HEIGHT)).get_rect().topright
-        stub_rect.topright = (stub_rect.topright[0] - 32, stub_rect.topright[1] + 16)
+        stub_rect.topright = (WIDTH - 32, 16)
         self.sound_icon = SoundIcon(
             self.sfx_manager, self.assets, center_pos=stub_rect.center
         )
@@ -509,32 +700,41 @@ class SFXStage(UIStage):
             SAVE_DATA["last_volume"] * self.sound_icon.slider.max_value
         )
 
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+        self._update_pipeline.append(self._update_sfx)
+        self._draw_pipeline.append(self._draw_sfx)
+
+    def _update_sfx(self, event_info: EventInfo):
         self.sound_icon.update(event_info)
 
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
+    def _draw_sfx(self, screen: pygame.Surface):
         self.sound_icon.draw(screen)
 
 
 class ExplosionStage(SFXStage):
+    __slots__ = ()
 
-    def update(self, event_info: EventInfo) -> None:
-        super().update(event_info)
-        self.explosion_manager.update(event_info["dt"])
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._update_pipeline.append(self._update_explosions)
+        self._draw_pipeline.append(self._draw_explosions)
+
+    def _update_explosions(self, event_info: EventInfo) -> None:
+        if self._explosion_manager is not None:
+            self._explosion_manager.update(event_info["dt"])
         self.turret_explosioner.update(event_info["dt"])
 
         # for event in event_info["events"]:
         #     if event.type == pygame.MOUSEBUTTONDOWN:
 
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
-        self.explosion_manager.draw(screen)
+    def _draw_explosions(self, screen: pygame.Surface):
+        if self._explosion_manager is not None:
+            self._explosion_manager.draw(screen)
         self.turret_explosioner.draw(screen)
 
 
 class PauseStage(ExplosionStage):
+    __slots__ = ("bg_darkener", "pause_buttons", "_gameplay_pipeline")
+
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
 
@@ -559,14 +759,20 @@ class PauseStage(ExplosionStage):
             for index, text in enumerate(button_texts)
         ]
 
-    def update(self, event_info: EventInfo):
+        # Everything registered so far only runs while the game isn't paused
+        self._gameplay_pipeline = self._update_pipeline
+        self._update_pipeline = [self._update_pause]
+        self._draw_pipeline.append(self._draw_pause)
+
+    def _update_pause(self, event_info: EventInfo):
         for event in event_info["events"]:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.paused = not self.paused
 
         if not self.paused:
-            super().update(event_info)
+            for update in self._gameplay_pipeline:
+                update(event_info)
             return
 
         for button in self.pause_buttons:
@@ -578,9 +784,7 @@ class PauseStage(ExplosionStage):
                 elif button.text == "main menu":
                     self.next_state = States.MAIN_MENU
 
-    def draw(self, screen: pygame.Surface):
-        super().draw(screen)
-
+    def _draw_pause(self, screen: pygame.Surface):
         if not self.paused:
             return
 
@@ -595,7 +799,7 @@ class TransitionStage(PauseStage):
     Handles game state transitions
     """
 
-    FADE_SPEED = 4
+    __slots__ = ()
 
     def __init__(self, switch_info: dict) -> None:
         super().__init__(switch_info)
@@ -604,8 +808,10 @@ class TransitionStage(PauseStage):
         # on to the next state
         self.switch_info = {}
 
-    def update(self, event_info: EventInfo):
-        super().update(event_info)
+        self._update_pipeline.append(self._update_transition)
+        self._draw_pipeline.append(self._draw_transition)
+
+    def _update_transition(self, event_info: EventInfo):
         """
         Update the transition stage
 
@@ -618,8 +824,7 @@ class TransitionStage(PauseStage):
             if self.transition.event:
                 self.next_state = States.LEVEL
 
-    def draw(self, screen: pygame.Surface) -> None:
-        super().draw(screen)
+    def _draw_transition(self, screen: pygame.Surface) -> None:
         self.transition.draw(screen)
 
 
@@ -628,6 +833,12 @@ class Level(TransitionStage):
     Final element of stages chain
     """
 
+    __slots__ = ()
+
+    def __init__(self, switch_info: dict) -> None:
+        super().__init__(switch_info)
+        self._freeze_collections()
+
     def update(self, event_info: EventInfo):
         """
         Update the Level state
@@ -635,7 +846,8 @@ class Level(TransitionStage):
         Parameters:
             event_info: Information on the window events
         """
-        super().update(event_info)
+        for update in self._update_pipeline:
+            update(event_info)
 
     def draw(self, screen: pygame.Surface):
         """
@@ -644,4 +856,5 @@ class Level(TransitionStage):
         Parameters:
             screen: pygame.Surface to draw on
         """
-        super().draw(screen)
+        for draw in self._draw_pipeline:
+            draw(screen)
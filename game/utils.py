@@ -2,6 +2,7 @@
 This file is a part of the 'Unnamed' source code.
 The source code is distributed under the MIT license.
 """
+import copy
 import json
 import pathlib
 import typing
@@ -81,13 +82,22 @@ def get_neighboring_tiles(
     return neighboring_tile_entities
 
 
-def load_settings(path: pathlib.Path) -> dict:
+@lru_cache(maxsize=None)
+def _read_settings(path: pathlib.Path) -> dict:
     with open(path) as f:
         settings = json.load(f)
 
     return settings
 
 
+def load_settings(path: pathlib.Path) -> dict:
+    """
+    Loads a settings file. The parsed JSON is cached, so every
+    caller gets its own copy to keep the cached one untouched
+    """
+    return copy.deepcopy(_read_settings(path))
+
+
 @lru_cache(maxsize=512)
 def load_font(size: int, font_path=FONT_DIR / "PixelMillenium.ttf"):
     return pygame.font.Font(font_path, size)
@@ -20,10 +20,11 @@ class ParticleManager(set):
         self.camera = camera
 
     def update(self, event_info: EventInfo) -> None:
+        dt = event_info["dt"]
         dead_particles = set()
 
         for particle in self:
-            particle.update(event_info["dt"])
+            particle.update(dt)
 
             if not particle.alive:
                 dead_particles.add(particle)
@@ -31,8 +32,9 @@ class ParticleManager(set):
         self.difference_update(dead_particles)
 
     def draw(self) -> None:
+        camera = self.camera
         for particle in self:
-            particle.draw(self.camera)
+            particle.draw(camera)
 
 
 class Particle:
@@ -125,10 +127,28 @@ class MovingParticle:
                 starting_alpha: Starting alpha
         """
         self.screen = screen
+        self.pos = pygame.Vector2()
+        self.vel = pygame.Vector2()
+        self.reset(image, pos, vel, alpha_speed, starting_alpha, lifespan)
+
+    def reset(
+        self,
+        image: pygame.Surface,
+        pos: Tuple[int],
+        vel: Tuple[int],
+        alpha_speed: int,
+        starting_alpha: int = 255,
+        lifespan: int = 0,
+    ):
+        """
+        (Re)starts the particle, so a dead one can be reused
+        instead of allocating a new one
+        """
         self.image = image
         self.alpha = starting_alpha
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(vel)
+        self.image.set_alpha(starting_alpha)
+        self.pos.update(pos)
+        self.vel.update(vel)
         self.alpha_speed = alpha_speed
         self.lifespan = lifespan
         self.current_lifespan = 0
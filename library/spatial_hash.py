@@ -0,0 +1,58 @@
+"""
+This file is a part of the 'Unnamed' source code.
+The source code is distributed under the MIT license.
+"""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pygame
+
+
+class SpatialHash:
+    """
+    Buckets objects into a grid of fixed size cells, so only
+    the objects near a rect have to be checked against it
+    """
+
+    def __init__(self, cell_size: int):
+        """
+        Parameters:
+            cell_size: Width and height of a cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+
+    def _cells_of(self, rect: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        size = self.cell_size
+        for x in range(rect.left // size, rect.right // size + 1):
+            for y in range(rect.top // size, rect.bottom // size + 1):
+                yield x, y
+
+    def insert(self, rect: pygame.Rect, obj: Any) -> None:
+        """
+        Adds an object to every cell its rect overlaps
+
+        Parameters:
+            rect: Area the object occupies
+            obj: The object to store
+        """
+        for cell in self._cells_of(rect):
+            self.cells.setdefault(cell, []).append(obj)
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """
+        Returns the objects sharing a cell with the rect, without duplicates.
+        These are only candidates, they still need an exact collision check.
+
+        Parameters:
+            rect: Area to look around
+        """
+        found = {}
+        for cell in self._cells_of(rect):
+            for obj in self.cells.get(cell, ()):
+                found[id(obj)] = obj
+
+        return list(found.values())
+
+    def clear(self) -> None:
+        self.cells.clear()
@@ -49,6 +49,11 @@ def get_images(
 
 
 def load_assets(state: str) -> dict:
+    # convert()/convert_alpha() need the display's pixel format
+    assert (
+        pygame.display.get_surface() is not None
+    ), "The display mode has to be set before loading assets"
+
     assets = {}
     path = Path("assets/images/")
 
@@ -85,6 +85,10 @@ class TileLayerMap:
             A pygame.Surface to blit to the main screen
         """
 
-        temp_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Converted to the display format so blitting the map every frame
+        # doesn't need a per-pixel format conversion
+        temp_surface = pygame.Surface(
+            (self.width, self.height), pygame.SRCALPHA
+        ).convert_alpha()
         self.render_map(temp_surface, tileset)
         return temp_surface
@@ -10,6 +10,18 @@ from typing import Sequence
 import pygame
 
 
+def fblits(screen: pygame.Surface, blit_sequence: Sequence) -> None:
+    """
+    Blits a sequence of (surface, pos) pairs in a single call.
+    Uses pygame-ce's Surface.fblits, falling back to Surface.blits
+    on vanilla pygame.
+    """
+    if hasattr(screen, "fblits"):
+        screen.fblits(blit_sequence)
+    else:
+        screen.blits(blit_sequence, doreturn=False)
+
+
 def circle_surf(radius, color):
     surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
     pygame.draw.circle(surf, color, (radius, radius), radius)